@@ -1,106 +1,195 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import numpy as np
-import time
-import re
+import glob
+import hashlib
+import json
+import os
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 st.title("Gapminder Dashboard")
 st.write("BIPM Project - Unlocking Lifetimes: Visualizing Progress in Longevity and Poverty Eradication")
 
-def parse_number(value):
+SUFFIX_EXPONENTS = {'k': 'e3', 'M': 'e6', 'B': 'e9'}
+
+def parse_number_series(series):
+    """
+    Convert a column of formatted numbers like '3.28M', '407k', '2650' to float64
+    """
+    # Rewrite suffixes as exponents ('3.28M' -> '3.28e6') so the float parse handles them
+    values = series.astype("string[pyarrow]").str.strip()
+    for suffix, exponent in SUFFIX_EXPONENTS.items():
+        values = values.str.replace(suffix, exponent, regex=False)
+    numbers = pd.to_numeric(values, errors='coerce')
+    return pd.Series(numbers.to_numpy(dtype="float64", na_value=np.nan), index=series.index, name=series.name)
+
+def read_tidy_csv(path, value_name, min_year, max_year, parse=parse_number_series, value_dtype="string[pyarrow]", chunksize=50_000):
     """
-    Convert formatted numbers like '3.28M', '407k', '2650' to actual numbers
+    Read the min_year-max_year columns of a wide gapminder CSV in row chunks
+    and return them in tidy (country, year, value) format, together with the
+    file's raw shape (countries, year columns)
     """
-    if pd.isna(value) or value == '':
-        return np.nan
+    columns = pd.read_csv(path, nrows=0).columns
+    n_year_columns = sum(c.isdigit() for c in columns)
+    year_cols = [c for c in columns if c.isdigit() and min_year <= int(c) <= max_year]
+    year_labels = pd.Index([int(c) for c in year_cols], name="year")
     
-    # If it's already a number, return it
-    if isinstance(value, (int, float)):
-        return float(value)
+    parts = []
+    n_countries = 0
+    for chunk in pd.read_csv(
+        path,
+        engine="c",
+        usecols=["country"] + year_cols,
+        dtype={"country": "category", **{c: value_dtype for c in year_cols}},
+        chunksize=chunksize
+    ):
+        n_countries += len(chunk)
+        
+        # Year labels become ints here, so the melted year column is already numeric
+        wide = chunk.set_index("country")
+        wide.columns = year_labels
+        
+        # Melt this chunk (rows stay in year-column order within each country),
+        # forward fill missing values per country in long format, then parse
+        tidy = wide.melt(value_name=value_name, ignore_index=False).reset_index()
+        tidy[value_name] = tidy.groupby("country", sort=False, observed=True)[value_name].ffill()
+        tidy[value_name] = parse(tidy[value_name])
+        parts.append(tidy)
     
-    # Convert to string and clean
-    value = str(value).strip()
+    return pd.concat(parts, ignore_index=True), (n_countries, n_year_columns)
+
+# Columns and dtypes of the processed dataset; a cached file with any other layout is rebuilt
+FINAL_DTYPES = {
+    "country": "category",
+    "year": "int16",
+    "population": "float32",
+    "life_expectancy": "float32",
+    "gni_per_capita": "float32"
+}
+
+# Parquet schema metadata key holding the loading status lines, shown again on a cache hit
+STATUS_METADATA_KEY = b"gapminder_status"
+
+def processed_cache_path(data_path, source_files):
+    """
+    Parquet cache path keyed on the source file mtimes and the processing code itself
+    """
+    key = hashlib.sha1()
+    for path in source_files:
+        key.update(f"{path}:{os.path.getmtime(path)};".encode())
+    with open(__file__, "rb") as f:
+        key.update(f.read())
+    return f"{data_path}final_{key.hexdigest()[:16]}.parquet"
+
+def read_processed_cache(cache_path):
+    """
+    Load the cached dataset and its status messages, or None if the file is
+    missing, unreadable or has an outdated layout
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        table = pq.read_table(cache_path)
+        cached = table.to_pandas()
+        status = json.loads((table.schema.metadata or {}).get(STATUS_METADATA_KEY, b"null"))
+    except Exception:
+        return None
+    if cached.dtypes.astype(str).to_dict() != FINAL_DTYPES or not isinstance(status, list):
+        return None
+    return cached, status
+
+def write_processed_cache(final_df, status, data_path, cache_path):
+    """
+    Atomically write the dataset (with its status messages as schema metadata)
+    to cache_path and drop cache files from older runs
+    """
+    table = pa.Table.from_pandas(final_df, preserve_index=False)
+    metadata = {**(table.schema.metadata or {}), STATUS_METADATA_KEY: json.dumps(status).encode()}
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
     
-    # Handle different suffixes
-    if value.endswith('k'):
-        return float(value[:-1]) * 1000
-    elif value.endswith('M'):
-        return float(value[:-1]) * 1000000
-    elif value.endswith('B'):
-        return float(value[:-1]) * 1000000000
-    else:
-        # Try to convert directly
-        try:
-            return float(value)
-        except:
-            return np.nan
-
-@st.cache_data
-def load_and_process_data():
+    for old_path in glob.glob(f"{data_path}final_*.parquet"):
+        if old_path != cache_path:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def data_source():
+    """
+    Data directory and processed-cache path; the cache path doubles as the key for in-memory caches.
+    Cached so reruns skip the file hashing; source changes are picked up within a minute
+    """
     # Load files (paths work both locally and in Docker)
-    import os
-    
     # Check if running in Docker (where files are directly in /app/data)
     if os.path.exists("data/pop.csv"):
         data_path = "data/"
     else:
         data_path = "app/data/"
     
-    population_df = pd.read_csv(f"{data_path}pop.csv")
-    life_expectancy_df = pd.read_csv(f"{data_path}lex.csv")
-    gni_df = pd.read_csv(f"{data_path}ny_gnp.csv")
-    
-    st.write("**Data loading info:**")
-    st.write(f"Population: {population_df.shape[0]} countries, {population_df.shape[1]-1} years")
-    st.write(f"Life Expectancy: {life_expectancy_df.shape[0]} countries, {life_expectancy_df.shape[1]-1} years")
-    st.write(f"GNI: {gni_df.shape[0]} countries, {gni_df.shape[1]-1} years")
-    
-    # Forward fill missing values
-    population_df = population_df.ffill(axis=1)
-    life_expectancy_df = life_expectancy_df.ffill(axis=1)
-    gni_df = gni_df.ffill(axis=1)
-    
-    # Convert to tidy format
-    pop_tidy = population_df.melt(id_vars=["country"], var_name="year", value_name="population")
-    life_tidy = life_expectancy_df.melt(id_vars=["country"], var_name="year", value_name="life_expectancy")
-    gni_tidy = gni_df.melt(id_vars=["country"], var_name="year", value_name="gni_per_capita")
-    
-    # Convert year to numeric
-    pop_tidy["year"] = pd.to_numeric(pop_tidy["year"], errors='coerce')
-    life_tidy["year"] = pd.to_numeric(life_tidy["year"], errors='coerce')
-    gni_tidy["year"] = pd.to_numeric(gni_tidy["year"], errors='coerce')
+    source_files = [f"{data_path}pop.csv", f"{data_path}lex.csv", f"{data_path}ny_gnp.csv"]
+    return data_path, processed_cache_path(data_path, source_files)
+
+@st.cache_data(max_entries=1)
+def load_and_process_data(data_path, cache_path):
+    # Reuse the processed dataset from disk while the source files are unchanged
+    cached = read_processed_cache(cache_path)
+    if cached is not None:
+        return cached
     
-    # THE KEY FIX: Parse the formatted numbers
-    st.write(" **Parsing formatted numbers...**")
+    # Status lines are returned with the data (and stored in the Parquet cache)
+    # so the caller can show them whether or not the data came from disk
+    status = []
     
-    # Parse population numbers (3.28M, 407k, etc.)
-    pop_tidy["population"] = pop_tidy["population"].apply(parse_number)
+    # Only overlapping years are read (1990-2023 based on GNI data)
+    min_year = 1990
+    max_year = 2023
     
-    # Life expectancy should already be numeric, but let's be safe
-    life_tidy["life_expectancy"] = pd.to_numeric(life_tidy["life_expectancy"], errors='coerce')
+    # Parse population and GNI numbers (3.28M, 407k, etc.) while reading;
+    # life expectancy should already be numeric, but let's be safe
+    status.append(" **Parsing formatted numbers...**")
+    pop_tidy, pop_shape = read_tidy_csv(f"{data_path}pop.csv", "population", min_year, max_year)
+    life_tidy, life_shape = read_tidy_csv(
+        f"{data_path}lex.csv",
+        "life_expectancy",
+        min_year,
+        max_year,
+        parse=lambda values: pd.to_numeric(values, errors='coerce')
+    )
+    gni_tidy, gni_shape = read_tidy_csv(f"{data_path}ny_gnp.csv", "gni_per_capita", min_year, max_year)
     
-    # Parse GNI numbers (25.3k, 89.5k, etc.)
-    gni_tidy["gni_per_capita"] = gni_tidy["gni_per_capita"].apply(parse_number)
+    status.append("**Data loading info:**")
+    status.append(f"Population: {pop_shape[0]} countries, {pop_shape[1]} years")
+    status.append(f"Life Expectancy: {life_shape[0]} countries, {life_shape[1]} years")
+    status.append(f"GNI: {gni_shape[0]} countries, {gni_shape[1]} years")
     
     # Check how much data we have after parsing
-    st.write(f"After parsing - Population records with valid data: {pop_tidy['population'].notna().sum():,}")
-    st.write(f"After parsing - Life expectancy records with valid data: {life_tidy['life_expectancy'].notna().sum():,}")
-    st.write(f"After parsing - GNI records with valid data: {gni_tidy['gni_per_capita'].notna().sum():,}")
-    
-    # Filter to overlapping years (1990-2023 based on GNI data)
-    min_year = 1990
-    max_year = 2023
-    
-    pop_filtered = pop_tidy[(pop_tidy["year"] >= min_year) & (pop_tidy["year"] <= max_year)]
-    life_filtered = life_tidy[(life_tidy["year"] >= min_year) & (life_tidy["year"] <= max_year)]
-    gni_filtered = gni_tidy[(gni_tidy["year"] >= min_year) & (gni_tidy["year"] <= max_year)]
+    status.append(f"After parsing - Population records with valid data: {pop_tidy['population'].notna().sum():,}")
+    status.append(f"After parsing - Life expectancy records with valid data: {life_tidy['life_expectancy'].notna().sum():,}")
+    status.append(f"After parsing - GNI records with valid data: {gni_tidy['gni_per_capita'].notna().sum():,}")
     
-    # Merge the datasets
-    merged1 = pd.merge(pop_filtered, life_filtered, on=["country", "year"], how="inner")
-    final_df = pd.merge(merged1, gni_filtered, on=["country", "year"], how="inner")
+    # Align the datasets on (country, year) instead of merging
+    final_df = pd.concat(
+        [
+            pop_tidy.set_index(["country", "year"]).sort_index(),
+            life_tidy.set_index(["country", "year"]).sort_index(),
+            gni_tidy.set_index(["country", "year"]).sort_index()
+        ],
+        axis=1,
+        join="inner"
+    ).reset_index()
     
-    st.write(f"After merging: {final_df.shape[0]:,} records from {final_df['country'].nunique()} countries")
+    status.append(f"After merging: {final_df.shape[0]:,} records from {final_df['country'].nunique()} countries")
     
     # Remove rows with missing essential data
     final_df = final_df.dropna(subset=["country", "year", "population", "life_expectancy", "gni_per_capita"])
@@ -112,23 +201,236 @@ def load_and_process_data():
         (final_df["gni_per_capita"] > 0)
     ]
     
-    # Convert year back to int
-    final_df["year"] = final_df["year"].astype(int)
+    # Downcast to compact dtypes; display precision is low
+    final_df = final_df[list(FINAL_DTYPES)].astype(FINAL_DTYPES)
+    
+    status.append(f"**Final dataset:** {len(final_df):,} records, {final_df['country'].nunique()} countries, years {final_df['year'].min()}-{final_df['year'].max()}")
+    
+    # Persist for the next cold start
+    write_processed_cache(final_df, status, data_path, cache_path)
+    
+    return final_df, status
+
+@st.cache_resource(max_entries=1)
+def index_by_year_country(data_path, cache_path):
+    """
+    Processed data indexed by (year, country), built once per data version and shared read-only
+    """
+    data, _ = load_and_process_data(data_path, cache_path)
+    return data.set_index(["year", "country"]).sort_index()
+
+@st.cache_data(max_entries=1)
+def dataset_meta(data_path, cache_path):
+    """
+    Max GNI and the sorted years and countries, cached alongside the data they describe
+    """
+    data, _ = load_and_process_data(data_path, cache_path)
+    return dict(
+        max_gni=float(data["gni_per_capita"].max()),
+        years=np.unique(data["year"].to_numpy()),
+        countries=np.unique(data["country"].to_numpy()).tolist()
+    )
+
+def select_year(data_idx, year, selected_countries):
+    """
+    Rows of the (year, country)-indexed data for one year and the selected countries;
+    countries without data for that year are skipped
+    """
+    try:
+        # The index is sorted by year, so this is a contiguous slice
+        year_rows = data_idx.iloc[data_idx.index.get_loc(year)]
+    except KeyError:
+        return data_idx.iloc[:0].reset_index()
+    selected = year_rows.index.get_level_values("country").isin(list(selected_countries))
+    return year_rows[selected].reset_index()
+
+def country_mask(df, selected_countries):
+    """
+    Boolean mask of rows whose categorical country is selected, compared on category codes
+    """
+    idx = df["country"].cat.categories.get_indexer(list(selected_countries))
+    return np.isin(df["country"].cat.codes.to_numpy(), idx[idx >= 0])
+
+def country_colors(countries):
+    """
+    Fixed color per selected country, shared by the main chart and the animation
+    """
+    palette = px.colors.qualitative.Plotly
+    return {country: palette[i % len(palette)] for i, country in enumerate(countries)}
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def build_year_view(data_path, cache_path, year, countries, max_gni):
+    """
+    Rows and bubble chart for one year, cached per (year, countries) selection
+    """
+    year_data = select_year(index_by_year_country(data_path, cache_path), year, countries)
+    if year_data.empty:
+        return year_data, None
+    
+    # Create the bubble chart
+    fig = px.scatter(
+        year_data,
+        x="gni_per_capita",
+        y="life_expectancy",
+        size="population",
+        color="country",
+        color_discrete_map=country_colors(countries),
+        hover_name="country",
+        hover_data={
+            "gni_per_capita": ":$,.0f",
+            "life_expectancy": ":.1f years",
+            "population": ":,.0f people",
+            "year": False
+        },
+        log_x=True,
+        size_max=60,
+        title=f" Life Expectancy vs Income Per Person - {year}",
+        labels={
+            "gni_per_capita": "Income per person (GDP per capita, PPP$ inflation-adjusted)",
+            "life_expectancy": "Life expectancy (years)"
+        }
+    )
+    
+    # Set consistent axis ranges
+    fig.update_xaxes(
+        range=[np.log10(300), np.log10(max_gni * 1.1)],
+        title="Income per person (GDP per capita, PPP$ inflation-adjusted) →"
+    )
+    
+    fig.update_yaxes(
+        range=[30, 90],
+        title="← Life expectancy (years)"
+    )
+    
+    fig.update_layout(
+        height=600,
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="top",
+            y=1,
+            xanchor="left",
+            x=1.02
+        )
+    )
+    
+    return year_data, fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_animation(data_path, cache_path, countries, max_gni, frame_seconds):
+    """
+    Bubble chart with one animation frame per year for the selected countries
+    """
+    data, _ = load_and_process_data(data_path, cache_path)
+    anim_data = data[country_mask(data, countries)]
+    if anim_data.empty:
+        return None
+    
+    # Frames are built straight from NumPy arrays as go.Scatter traces; the layout is shared
+    frame_ms = int(frame_seconds * 1000)
+    play_args = {"frame": {"duration": frame_ms, "redraw": False}, "fromcurrent": True, "transition": {"duration": frame_ms // 2}}
+    stop_args = {"frame": {"duration": 0, "redraw": False}, "mode": "immediate", "transition": {"duration": 0}}
+    frame_years = np.unique(anim_data["year"].to_numpy())
+    
+    layout = go.Layout(
+        title=" Life Expectancy vs Income Per Person",
+        xaxis=dict(
+            type="log",
+            range=[np.log10(300), np.log10(max_gni * 1.1)],
+            title="Income per person (GDP per capita, PPP$ inflation-adjusted)"
+        ),
+        yaxis=dict(range=[30, 90], title="Life expectancy (years)"),
+        height=600,
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            yanchor="top",
+            y=1,
+            xanchor="left",
+            x=1.02
+        ),
+        updatemenus=[dict(
+            type="buttons",
+            direction="left",
+            x=0.1,
+            y=0,
+            xanchor="right",
+            yanchor="top",
+            pad=dict(r=10, t=70),
+            buttons=[
+                dict(label="▶", method="animate", args=[None, play_args]),
+                dict(label="◼", method="animate", args=[[None], stop_args])
+            ]
+        )],
+        sliders=[dict(
+            x=0.1,
+            y=0,
+            len=0.9,
+            pad=dict(b=10, t=60),
+            currentvalue=dict(prefix="year="),
+            steps=[dict(label=str(year), method="animate", args=[[str(year)], stop_args]) for year in frame_years]
+        )]
+    )
+    
+    # Same bubble scaling as px.scatter(size_max=60); one trace per country keeps a
+    # legend entry per country, colored from the same map as the main chart
+    size_ref = 2.0 * float(anim_data["population"].max()) / 60 ** 2
+    colors = country_colors(countries)
+    present = set(anim_data["country"].astype(str))
+    trace_countries = [country for country in countries if country in present]
+    rows = {key: group for key, group in anim_data.groupby(["year", "country"], observed=True)}
+    empty = anim_data.iloc[:0]
     
-    st.write(f"**Final dataset:** {len(final_df):,} records, {final_df['country'].nunique()} countries, years {final_df['year'].min()}-{final_df['year'].max()}")
+    frames = []
+    for year in frame_years:
+        traces = []
+        for country in trace_countries:
+            country_data = rows.get((year, country), empty)
+            traces.append(go.Scatter(
+                x=country_data["gni_per_capita"].to_numpy(),
+                y=country_data["life_expectancy"].to_numpy(),
+                customdata=country_data["population"].to_numpy(),
+                ids=[country] * len(country_data),
+                name=country,
+                legendgroup=country,
+                mode="markers",
+                marker=dict(
+                    size=country_data["population"].to_numpy(),
+                    sizemode="area",
+                    sizeref=size_ref,
+                    color=colors[country]
+                ),
+                hovertemplate=(
+                    f"<b>{country}</b><br>Income: $%{{x:,.0f}}<br>Life expectancy: %{{y:.1f}} years"
+                    "<br>Population: %{customdata:,.0f} people<extra></extra>"
+                )
+            ))
+        frames.append(go.Frame(data=traces, name=str(year)))
     
-    return final_df
+    return go.Figure(data=frames[0].data, layout=layout, frames=frames)
+
+@st.cache_data(show_spinner=False)
+def countries_markdown(countries):
+    """
+    Bullet list of all countries as a single markdown string
+    """
+    return "\n".join(f"- {country}" for country in countries)
 
 # Load the data
-data = load_and_process_data()
+data_path, cache_path = data_source()
+data, load_status = load_and_process_data(data_path, cache_path)
+for message in load_status:
+    st.write(message)
 
 if len(data) == 0:
     st.error("No data available after processing!")
     st.stop()
 
-# Get available years and countries
-years = sorted(data["year"].unique())
-countries = sorted(data["country"].unique())
+# Get available years and countries (computed once per data version)
+meta = dataset_meta(data_path, cache_path)
+years = meta["years"]
+countries = meta["countries"]
+max_gni = meta["max_gni"]
 
 # Sidebar controls
 st.sidebar.header(" Controls")
@@ -136,9 +438,9 @@ st.sidebar.header(" Controls")
 # Year slider
 selected_year = st.sidebar.slider(
     "Select Year",
-    min_value=min(years),
-    max_value=max(years),
-    value=max(years),
+    min_value=int(years[0]),
+    max_value=int(years[-1]),
+    value=int(years[-1]),
     step=1
 )
 
@@ -164,66 +466,15 @@ selected_countries = st.sidebar.multiselect(
 # Show dataset info
 with st.sidebar.expander("Dataset Info"):
     st.write(f"**Countries:** {len(countries)}")
-    st.write(f"**Years:** {min(years)}-{max(years)}")
+    st.write(f"**Years:** {years[0]}-{years[-1]}")
     st.write(f"**Records:** {len(data):,}")
 
 # Main visualization
 if selected_countries:
-    filtered_data = data[
-        (data["year"] == selected_year) & 
-        (data["country"].isin(selected_countries))
-    ]
+    # Rows and bubble chart for the selected year, looked up once through the (year, country) index
+    filtered_data, fig = build_year_view(data_path, cache_path, selected_year, tuple(sorted(selected_countries)), max_gni)
     
     if not filtered_data.empty:
-        # Calculate max values for consistent scaling
-        max_gni = data["gni_per_capita"].max()
-        
-        # Create the bubble chart
-        fig = px.scatter(
-            filtered_data,
-            x="gni_per_capita",
-            y="life_expectancy",
-            size="population",
-            color="country",
-            hover_name="country",
-            hover_data={
-                "gni_per_capita": ":$,.0f",
-                "life_expectancy": ":.1f years",
-                "population": ":,.0f people",
-                "year": False
-            },
-            log_x=True,
-            size_max=60,
-            title=f" Life Expectancy vs Income Per Person - {selected_year}",
-            labels={
-                "gni_per_capita": "Income per person (GDP per capita, PPP$ inflation-adjusted)",
-                "life_expectancy": "Life expectancy (years)"
-            }
-        )
-        
-        # Set consistent axis ranges
-        fig.update_xaxes(
-            range=[np.log10(300), np.log10(max_gni * 1.1)],
-            title="Income per person (GDP per capita, PPP$ inflation-adjusted) →"
-        )
-        
-        fig.update_yaxes(
-            range=[30, 90],
-            title="← Life expectancy (years)"
-        )
-        
-        fig.update_layout(
-            height=600,
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                yanchor="top",
-                y=1,
-                xanchor="left",
-                x=1.02
-            )
-        )
-        
         st.plotly_chart(fig, use_container_width=True)
         
         st.write(f"Showing **{len(filtered_data)} countries** for **{selected_year}**")
@@ -231,9 +482,9 @@ if selected_countries:
         # Show data table
         if st.checkbox(" Show data table"):
             display_data = filtered_data[["country", "population", "life_expectancy", "gni_per_capita"]].copy()
-            display_data["population"] = display_data["population"].apply(lambda x: f"{x:,.0f}")
-            display_data["life_expectancy"] = display_data["life_expectancy"].apply(lambda x: f"{x:.1f}")
-            display_data["gni_per_capita"] = display_data["gni_per_capita"].apply(lambda x: f"${x:,.0f}")
+            display_data["population"] = display_data["population"].map("{:,.0f}".format)
+            display_data["life_expectancy"] = display_data["life_expectancy"].map("{:.1f}".format)
+            display_data["gni_per_capita"] = display_data["gni_per_capita"].map("${:,.0f}".format)
             display_data.columns = ["Country", "Population", "Life Expectancy", "Income per Person"]
             st.dataframe(display_data, use_container_width=True)
     else:
@@ -249,48 +500,16 @@ if selected_countries:
     animation_speed = st.sidebar.slider("⚡ Speed (seconds per year)", 0.1, 2.0, 0.5, 0.1)
     
     if st.sidebar.button("▶️ Play Animation", type="primary"):
-        chart_placeholder = st.empty()
-        progress_bar = st.progress(0)
-        
-        max_gni = data["gni_per_capita"].max()
-        
-        for i, year in enumerate(years):
-            progress_bar.progress((i + 1) / len(years))
-            
-            year_data = data[
-                (data["year"] == year) & 
-                (data["country"].isin(selected_countries))
-            ]
-            
-            if not year_data.empty:
-                fig = px.scatter(
-                    year_data,
-                    x="gni_per_capita",
-                    y="life_expectancy",
-                    size="population",
-                    color="country",
-                    hover_name="country",
-                    log_x=True,
-                    size_max=60,
-                    title=f" Life Expectancy vs Income Per Person - {year}"
-                )
-                
-                fig.update_xaxes(range=[np.log10(300), np.log10(max_gni * 1.1)])
-                fig.update_yaxes(range=[30, 90])
-                fig.update_layout(height=600)
-                
-                chart_placeholder.plotly_chart(fig, use_container_width=True)
-            
-            time.sleep(animation_speed)
-        
-        progress_bar.empty()
-        st.success("Animation complete!")
+        # All years go to the browser in one figure; Plotly animates the frames client-side
+        fig = build_animation(data_path, cache_path, tuple(sorted(selected_countries)), max_gni, animation_speed)
+        if fig is not None:
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.warning("⚠️ No data available for selected countries")
 
 # Show all countries
 with st.expander(" All Available Countries"):
-    cols = st.columns(4)
-    for i, country in enumerate(countries):
-        cols[i % 4].write(f"• {country}")
+    st.markdown(countries_markdown(tuple(countries)))
 
 st.markdown("---")
 st.markdown("""